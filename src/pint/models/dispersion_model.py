@@ -262,8 +262,8 @@ class DispersionDM(Dispersion):
             pn, idxf, idxv = split_prefixed_name(param_name)
             order = idxv
         dms = self.get_DM_terms()
-        dm_terms = np.longdouble(np.zeros(len(dms)))
-        dm_terms[order] = np.longdouble(1.0)
+        dm_terms = np.zeros(len(dms), dtype=np.longdouble)
+        dm_terms[order] = 1.0
         if self.DMEPOCH.value is None:
             if any(t.value != 0 for t in dms[1:]):
                 # Should be ruled out by validate()
@@ -1,13 +1,50 @@
 """Polynomial pulsar spindown."""
+
 # spindown.py
 # Defines Spindown timing model class
 import astropy.units as u
 import numpy
 
+try:
+    from erfa import DAYSEC as SECS_PER_DAY
+except ImportError:
+    from astropy._erfa import DAYSEC as SECS_PER_DAY
+
 from pint.models.parameter import MJDParameter, prefixParameter
 from pint.models.timing_model import MissingParameter, PhaseComponent
 from pint.pulsar_mjd import Time
-from pint.utils import split_prefixed_name, taylor_horner, taylor_horner_deriv
+from pint.utils import split_prefixed_name, taylor_horner_deriv
+
+
+def _horner(x, coeffs):
+    """Evaluate the power series ``sum(coeffs[k] * x**k)`` by the Horner scheme.
+
+    This gives the same result as :func:`numpy.polynomial.polynomial.polyval`
+    for a one-dimensional ``coeffs``, but every step updates a single output
+    array in place rather than allocating new temporaries the size of ``x``.
+    That matters for long double TOA arrays, which are slow to allocate and
+    to stream through memory.
+
+    Spindown series are short and often padded with zeros (the constant phase
+    term, unset higher derivatives), so the first product is taken directly
+    and additions of zero coefficients are skipped, each of which would
+    otherwise be a full pass over ``x``.
+
+    The result is always a bare array, even if ``x`` is an array subclass
+    such as a table column.
+    """
+    x = numpy.asarray(x)
+    dtype = numpy.result_type(x, coeffs)
+    if len(coeffs) == 1:
+        return numpy.full(numpy.shape(x), coeffs[0], dtype=dtype)
+    result = numpy.multiply(x, coeffs[-1], dtype=dtype)
+    for c in coeffs[-2:0:-1]:
+        if c:
+            result += c
+        result *= x
+    if coeffs[0]:
+        result += coeffs[0]
+    return result
 
 
 class Spindown(PhaseComponent):
@@ -77,10 +114,26 @@ class Spindown(PhaseComponent):
 
     def setup(self):
         super().setup()
-        self.num_spin_terms = len(self.F_terms)
+        self._setup_F_terms()
+        self._pepoch_key = None
+        self._dt_cache = None
         # Add derivative functions
-        for fp in list(self.get_prefix_mapping_component("F").values()) + ["F0"]:
+        f_params = list(self.get_prefix_mapping_component("F").values()) + ["F0"]
+        for fp in f_params:
             self.register_deriv_funcs(self.d_phase_d_F, fp)
+        # Which column of d_phase_d_F_all belongs to each F parameter, so that
+        # d_phase_d_F does not have to parse the name on every call
+        self._F_deriv_index = {fp: split_prefixed_name(fp)[2] for fp in f_params}
+        self._F_deriv_unit = {fp: 1 / getattr(self, fp).units for fp in f_params}
+
+    def __getstate__(self):
+        # The dt and derivative caches hold TOA-sized arrays and are keyed on
+        # the identity of the TOA column and delay, so a copy could never use
+        # them; leave them out of copies and pickles.
+        state = self.__dict__.copy()
+        state["_dt_cache"] = None
+        state["_d_phase_d_F_cache"] = None
+        return state
 
     def validate(self):
         super().validate()
@@ -113,6 +166,82 @@ class Spindown(PhaseComponent):
         """Return a list of the spin term values in the model: [F0, F1, ..., FN]."""
         return self._parent.get_prefix_list("F", start_index=0)
 
+    def _setup_F_terms(self):
+        """Record which F parameters are set, as the spin-term caches expect."""
+        self._F_param_names = tuple(self.F_terms)
+        self.num_spin_terms = len(self._F_param_names)
+        self._F_params = tuple(getattr(self, fp) for fp in self._F_param_names)
+        # An F parameter added or set after setup() would be ignored by the
+        # caches; checking for these is much cheaper than rebuilding the list.
+        self._F_next_name = "F%d" % self.num_spin_terms
+        self._F_num_params = len(self.params)
+        self._invalidate_fterms()
+
+    def _check_F_terms(self):
+        """Redo :meth:`_setup_F_terms` if the set of F parameters has changed."""
+        if len(self.params) != self._F_num_params or (
+            self._F_next_name in self.params
+            and getattr(self, self._F_next_name).quantity is not None
+        ):
+            self._setup_F_terms()
+
+    def _invalidate_fterms(self):
+        """Forget the cached spin-term arrays; they are rebuilt on next use."""
+        self._fterms_key = None
+        self._fterms_arr = None
+        self._phase_coeffs = None
+        self._freq_coeffs = None
+        self._d_phase_d_F_cache = None
+
+    def _get_fterms(self):
+        """Return [0, F0, F1, ..., FN] as a long double array without units.
+
+        The values are in the parameters' own units (Hz/s^n), so the array can
+        be used as Taylor coefficients for a time in seconds. The array is
+        cached and only rebuilt when one of the F parameters has been set since
+        the last call; setting a parameter always stores a new quantity object,
+        so comparing identities is enough to notice the change.
+        """
+        self._check_F_terms()
+        params = self._F_params
+        key = tuple(p.quantity for p in params)
+        if self._fterms_key is None or any(
+            new is not old for new, old in zip(key, self._fterms_key)
+        ):
+            fterms = numpy.zeros(self.num_spin_terms + 1, dtype=numpy.longdouble)
+            fterms[1:] = [p.value for p in params]
+            self._fterms_arr = fterms
+            factorials = self._factorials()
+            self._phase_coeffs = fterms / factorials
+            self._freq_coeffs = fterms[1:] / factorials[:-1]
+            self._fterms_key = key
+        return self._fterms_arr
+
+    def _factorials(self):
+        """Return [0!, 1!, ..., N!] as long doubles, N being the number of spin terms."""
+        f = numpy.ones(self.num_spin_terms + 1, dtype=numpy.longdouble)
+        f[1:] = numpy.cumprod(numpy.arange(1, self.num_spin_terms + 1, dtype=f.dtype))
+        return f
+
+    def _get_phase_coeffs(self):
+        """Return the power-series coefficients [0, F0/1!, F1/2!, ..., FN/(N+1)!].
+
+        Dividing the Taylor coefficients by the factorials once turns the
+        spindown phase into a plain polynomial in dt (in seconds), which can be
+        evaluated with a bare Horner loop.
+        """
+        self._get_fterms()
+        return self._phase_coeffs
+
+    def _get_freq_coeffs(self):
+        """Return the power-series coefficients [F0/0!, F1/1!, ..., FN/N!].
+
+        These are the coefficients of the spin frequency, the time derivative
+        of the spindown phase, as a polynomial in dt (in seconds).
+        """
+        self._get_fterms()
+        return self._freq_coeffs
+
     def get_dt(self, toas, delay):
         """Return dt, the time from the phase 0 epoch to each TOA.  The
         phase 0 epoch is assumed to be PEPOCH.  If PEPOCH is not set,
@@ -123,14 +252,63 @@ class Spindown(PhaseComponent):
         tempo-style TZRMJD and related parameters for specifying absolute
         pulse phase will be handled at a higher level in the code.
         """
-        tbl = toas.table
-        if self.PEPOCH.value is None:
-            phsepoch_ld = (tbl["tdb"][0] - delay[0]).tdb.mjd_long
+        return self._compute_dt_seconds(toas, delay) << u.second
+
+    def _get_dt_seconds(self, toas, delay):
+        """Return the same as :meth:`get_dt`, as a read-only bare array in seconds.
+
+        The phase, its derivatives with respect to the spin terms and with
+        respect to the delay are all evaluated at the same TOAs and delay
+        during a fit step, so the last dt is kept and reused as long as the
+        TDB column, the delay and PEPOCH are the same objects as before.
+        """
+        key = (toas.table["tdbld"], delay, self.PEPOCH.quantity)
+        cache = self._dt_cache
+        if cache is None or any(new is not old for new, old in zip(key, cache[0])):
+            dt = self._compute_dt_seconds(toas, delay)
+            dt.flags.writeable = False
+            self._dt_cache = cache = (key, dt)
+        return cache[1]
+
+    def _compute_dt_seconds(self, toas, delay):
+        """Return the same as :meth:`get_dt`, as a bare long double array in seconds.
+
+        The time difference and the delay are combined in a single pass over
+        the TOAs, without going through astropy unit conversions.
+        """
+        delay_s = delay.to_value(u.second) if hasattr(delay, "unit") else delay
+        if self.PEPOCH.quantity is None:
+            phsepoch_ld = self._get_first_toa_epoch_ld(toas, delay_s)
         else:
-            phsepoch_ld = self.PEPOCH.quantity.tdb.mjd_long
-        dt = (tbl["tdbld"] - phsepoch_ld) * u.day - delay
+            phsepoch_ld = self._get_pepoch_ld()
+        # Work in place on a single new array rather than one per operation;
+        # the column is unwrapped first so the result is a bare ndarray
+        dt = numpy.subtract(numpy.asarray(toas.table["tdbld"]), phsepoch_ld)
+        dt *= SECS_PER_DAY
+        dt -= delay_s
         return dt
 
+    def _get_first_toa_epoch_ld(self, toas, delay_s):
+        """Return the first pulsar frame TOA as a long double MJD in TDB.
+
+        This is the epoch used in place of PEPOCH when PEPOCH is not set. It is
+        taken from the long double TDB column so no Time arithmetic is needed.
+        """
+        return toas.table["tdbld"][0] - delay_s[0] / SECS_PER_DAY
+
+    def _get_pepoch_ld(self):
+        """Return PEPOCH as a long double MJD in TDB.
+
+        Converting the PEPOCH time to TDB is costly compared to the rest of
+        the phase calculation, and the result only depends on PEPOCH, so it is
+        cached until PEPOCH is assigned a new value.
+        """
+        pepoch = self.PEPOCH.quantity
+        if pepoch is not self._pepoch_key:
+            self._pepoch_ld = pepoch.tdb.mjd_long
+            self._pepoch_key = pepoch
+        return self._pepoch_ld
+
     def spindown_phase(self, toas, delay):
         """Spindown phase function.
 
@@ -141,11 +319,10 @@ class Spindown(PhaseComponent):
 
         returns an array of phases in long double
         """
-        dt = self.get_dt(toas, delay)
-        # Add the [0.0] because that is the constant phase term
-        fterms = [0.0 * u.dimensionless_unscaled] + self.get_spin_terms()
-        phs = taylor_horner(dt.to(u.second), fterms)
-        return phs.to(u.dimensionless_unscaled)
+        dt = self._get_dt_seconds(toas, delay)
+        # The cached coefficients start with 0.0 because that is the constant phase term
+        phs = _horner(dt, self._get_phase_coeffs())
+        return phs * u.dimensionless_unscaled
 
     def change_pepoch(self, new_epoch, toas=None, delay=None):
         """Move PEPOCH to a new time and change the related parameters.
@@ -172,10 +349,10 @@ class Spindown(PhaseComponent):
                     "`PEPOCH` is not in the model, thus, 'toa' and"
                     " 'delay' should be given."
                 )
-            tbl = toas.table
-            phsepoch_ld = (tbl["tdb"][0] - delay[0]).tdb.mjd_long
+            delay_s = delay.to_value(u.second) if hasattr(delay, "unit") else delay
+            phsepoch_ld = self._get_first_toa_epoch_ld(toas, delay_s)
         else:
-            phsepoch_ld = self.PEPOCH.quantity.tdb.mjd_long
+            phsepoch_ld = self._get_pepoch_ld()
         dt = (new_epoch.tdb.mjd_long - phsepoch_ld) * u.day
         fterms = [0.0 * u.Unit("")] + self.get_spin_terms()
         # rescale the fterms
@@ -197,22 +374,55 @@ class Spindown(PhaseComponent):
                 result += getattr(self, param).as_parfile_line(format=format)
         return result
 
+    def d_phase_d_F_all(self, toas, delay):
+        """Calculate the derivatives of the phase with respect to all spin terms.
+
+        The derivative with respect to ``Fk`` is ``dt**(k+1) / (k+1)!``, so all
+        of them are built together, each from the previous one with a single
+        multiplication. The result is cached along with dt, so that computing
+        the design matrix, which asks for the spin terms one at a time with the
+        same TOAs and delay, only does this once.
+
+        Parameters
+        ----------
+        toas : pint.toa.TOAs
+            The TOAs at which to evaluate the derivatives.
+        delay : astropy.units.Quantity
+            The time delay from the TOA to time of pulse emission at the pulsar.
+
+        Returns
+        -------
+        numpy.ndarray
+            Read-only double precision array of shape
+            ``(ntoas, num_spin_terms)``; column ``k`` is the derivative with
+            respect to ``Fk``, in units of ``1 / Fk.units``.
+        """
+        self._check_F_terms()
+        dt_ld = self._get_dt_seconds(toas, delay)
+        cache = self._d_phase_d_F_cache
+        if cache is None or cache[0] is not dt_ld:
+            # dt has to be formed in long double, but the derivatives only go
+            # into the (double precision) design matrix, so the powers can be
+            # taken in double precision, which numpy vectorizes far better.
+            dt = dt_ld.astype(numpy.float64)
+            # One contiguous row per spin term; returned transposed
+            derivs = numpy.empty((self.num_spin_terms, len(dt)))
+            derivs[0] = dt
+            for k in range(1, self.num_spin_terms):
+                numpy.multiply(derivs[k - 1], dt, out=derivs[k])
+                derivs[k] /= k + 1
+            derivs.flags.writeable = False
+            self._d_phase_d_F_cache = cache = (dt_ld, derivs)
+        return cache[1].T
+
     def d_phase_d_F(self, toas, param, delay):
         """Calculate the derivative wrt to an spin term."""
-        par = getattr(self, param)
-        unit = par.units
-        pn, idxf, idxv = split_prefixed_name(param)
-        order = idxv + 1
-        fterms = [0.0 * u.Unit("")] + self.get_spin_terms()
-        # make the choosen fterms 1 others 0
-        fterms = [ft * numpy.longdouble(0.0) / unit for ft in fterms]
-        fterms[order] += numpy.longdouble(1.0)
-        dt = self.get_dt(toas, delay)
-        d_pphs_d_f = taylor_horner(dt.to(u.second), fterms)
-        return d_pphs_d_f.to(1 / unit)
+        idxv = self._F_deriv_index[param]
+        return u.Quantity(
+            self.d_phase_d_F_all(toas, delay)[:, idxv], self._F_deriv_unit[param]
+        )
 
     def d_spindown_phase_d_delay(self, toas, delay):
-        dt = self.get_dt(toas, delay)
-        fterms = [0.0] + self.get_spin_terms()
-        d_pphs_d_delay = taylor_horner_deriv(dt.to(u.second), fterms)
-        return -d_pphs_d_delay.to(1 / u.second)
+        dt = self._get_dt_seconds(toas, delay)
+        d_pphs_d_delay = _horner(dt, self._get_freq_coeffs())
+        return numpy.negative(d_pphs_d_delay, out=d_pphs_d_delay) << (1 / u.second)
@@ -1635,7 +1635,7 @@ class TimingModel:
         if delay is None:
             delay = self.delay(toas)
         par = getattr(self, param)
-        result = np.longdouble(np.zeros(toas.ntoas)) / par.units
+        result = np.zeros(toas.ntoas, dtype=np.longdouble) / par.units
         phase_derivs = self.phase_deriv_funcs
         if param in list(phase_derivs.keys()):
             for df in phase_derivs[param]:
@@ -1651,7 +1651,7 @@ class TimingModel:
             #                         d_delay_d_param
 
             d_delay_d_p = self.d_delay_d_param(toas, param)
-            dpdd_result = np.longdouble(np.zeros(toas.ntoas)) / u.second
+            dpdd_result = np.zeros(toas.ntoas, dtype=np.longdouble) / u.second
             for dpddf in self.d_phase_d_delay_funcs:
                 dpdd_result += dpddf(toas, delay)
             result = dpdd_result * d_delay_d_p
@@ -1660,7 +1660,7 @@ class TimingModel:
     def d_delay_d_param(self, toas, param, acc_delay=None):
         """Return the derivative of delay with respect to the parameter."""
         par = getattr(self, param)
-        result = np.longdouble(np.zeros(toas.ntoas) << (u.s / par.units))
+        result = np.zeros(toas.ntoas, dtype=np.longdouble) << (u.s / par.units)
         delay_derivs = self.delay_deriv_funcs
         if param not in list(delay_derivs.keys()):
             raise AttributeError(
@@ -29,10 +29,19 @@ named_colors = [
 
 
 class ColorMode:
-    """Base Class for color modes."""
+    """Base Class for color modes.
+
+    ``plotColorMode`` plots all of the TOAs; the selected TOAs are drawn on
+    top of them by the application, in the mode's ``selected_color``.
+    """
+
+    selected_color = "orange"
 
     def __init__(self, application):
         self.application = application  # PLKWidget for pintk
+        # groups of TOAs to color, and the TOA table they were found for
+        self.groups = None
+        self.groupsTable = None
 
     def displayInfo(self):
         raise NotImplementedError
@@ -40,6 +49,34 @@ class ColorMode:
     def plotColorMode(self):
         raise NotImplementedError
 
+    def makeGroups(self):
+        """Return a list of (boolean mask of TOAs, color) for the groups of TOAs"""
+        raise NotImplementedError
+
+    def plotGroups(self):
+        """
+        Plot each group of TOAs from ``makeGroups`` in its color
+
+        The groups are only found again when the TOA table changes.
+        """
+        table = self.application.psr.all_toas.table
+        if self.groupsTable is not table:
+            # keep the indices of each group rather than its mask
+            self.groups = [
+                (np.flatnonzero(toas), color) for toas, color in self.makeGroups()
+            ]
+            self.groupsTable = table
+        for toas, color in self.groups:
+            if self.application.yerrs is None:
+                self.application.plkAxes.scatter(
+                    self.application.xvalsValue[toas],
+                    self.application.yvalsValue[toas],
+                    marker=".",
+                    color=color,
+                )
+            else:
+                self.application.plotErrorbar(toas, color=color)
+
 
 class DefaultMode(ColorMode):
     """
@@ -65,27 +102,22 @@ class DefaultMode(ColorMode):
         """
         if self.application.yerrs is None:
             self.application.plkAxes.scatter(
-                self.application.xvals[~self.application.selected],
-                self.application.yvals[~self.application.selected],
+                self.application.xvalsValue,
+                self.application.yvalsValue,
                 marker=".",
                 color="blue",
             )
             self.application.plkAxes.scatter(
-                self.application.xvals[self.application.jumped],
-                self.application.yvals[self.application.jumped],
+                self.application.xvalsValue[self.application.jumped],
+                self.application.yvalsValue[self.application.jumped],
                 marker=".",
                 color="red",
             )
-            self.application.plkAxes.scatter(
-                self.application.xvals[self.application.selected],
-                self.application.yvals[self.application.selected],
-                marker=".",
-                color="orange",
-            )
         else:
-            self.application.plotErrorbar(~self.application.selected, color="blue")
+            self.application.plotErrorbar(
+                np.ones_like(self.application.selected), color="blue"
+            )
             self.application.plotErrorbar(self.application.jumped, color="red")
-            self.application.plotErrorbar(self.application.selected, color="orange")
 
 
 class FreqMode(ColorMode):
@@ -94,6 +126,8 @@ class FreqMode(ColorMode):
     according to their frequency.
     """
 
+    selected_color = "#362511"  # brown
+
     def __init__(self, application):
         super().__init__(application)
         self.mode_name = "freq"
@@ -117,7 +151,9 @@ class FreqMode(ColorMode):
         """
         Plots application's residuals in proper color scheme.
         """
+        self.plotGroups()
 
+    def makeGroups(self):
         colorGroups = [
             "xkcd:dark red",  # dark red
             "xkcd:red",  # red
@@ -131,46 +167,16 @@ class FreqMode(ColorMode):
         ]
         highfreqs = [300.0, 400.0, 500.0, 700.0, 1000.0, 1800.0, 3000.0, 8000.0]
 
+        freqs = self.application.psr.all_toas.get_freqs().value
         freqGroups = []
         for ii, highfreq in enumerate(highfreqs):
             if ii == 0:
-                freqGroups.append(
-                    self.application.psr.all_toas.get_freqs().value < highfreq
-                )
+                freqGroups.append(freqs < highfreq)
             else:
-                freqGroups.append(
-                    (self.application.psr.all_toas.get_freqs().value < highfreq)
-                    & (
-                        self.application.psr.all_toas.get_freqs().value
-                        >= highfreqs[ii - 1]
-                    )
-                )
-        freqGroups.append(
-            self.application.psr.all_toas.get_freqs().value >= highfreqs[-1]
-        )
+                freqGroups.append((freqs < highfreq) & (freqs >= highfreqs[ii - 1]))
+        freqGroups.append(freqs >= highfreqs[-1])
 
-        for index in range(len(freqGroups)):
-            if self.application.yerrs is None:
-                self.application.plkAxes.scatter(
-                    self.application.xvals[freqGroups[index]],
-                    self.application.yvals[freqGroups[index]],
-                    marker=".",
-                    color=colorGroups[index],
-                )
-            else:
-                self.application.plotErrorbar(
-                    freqGroups[index], color=colorGroups[index]
-                )
-        # The following is for selected TOAs
-        if self.application.yerrs is None:
-            self.application.plkAxes.scatter(
-                self.application.xvals[self.application.selected],
-                self.application.yvals[self.application.selected],
-                marker=".",
-                color="#362511",  # brown
-            )
-        else:
-            self.application.plotErrorbar(self.application.selected, color="#362511")
+        return list(zip(freqGroups, colorGroups))
 
 
 class NameMode(ColorMode):
@@ -190,7 +196,9 @@ class NameMode(ColorMode):
         """
         Plots application's residuals in proper color scheme.
         """
+        self.plotGroups()
 
+    def makeGroups(self):
         all_names = np.array(
             [f["name"] for f in self.application.psr.all_toas.get_flags()]
         )
@@ -198,39 +206,11 @@ class NameMode(ColorMode):
         N = len(single_names)
         cmap = matplotlib.cm.get_cmap("brg")
         colorGroups = [matplotlib.colors.rgb2hex(cmap(v)) for v in np.linspace(0, 1, N)]
-        colorGroups += ["orange"]
-
-        freqGroups = []
-        index = 0
-        for name in single_names:
-            index += 1
-            freqGroups.append(all_names == name)
-            index += 1
 
-        for index in range(N):
-            if self.application.yerrs is None:
-                self.application.plkAxes.scatter(
-                    self.application.xvals[freqGroups[index]],
-                    self.application.yvals[freqGroups[index]],
-                    marker=".",
-                    color=colorGroups[index],
-                )
-            else:
-                self.application.plotErrorbar(
-                    freqGroups[index], color=colorGroups[index]
-                )
-
-        if self.application.yerrs is None:
-            self.application.plkAxes.scatter(
-                self.application.xvals[self.application.selected],
-                self.application.yvals[self.application.selected],
-                marker=".",
-                color=colorGroups[N],
-            )
-        else:
-            self.application.plotErrorbar(
-                self.application.selected, color=colorGroups[N]
-            )
+        return [
+            (all_names == name, colorGroups[index])
+            for index, name in enumerate(single_names)
+        ]
 
 
 class ObsMode(ColorMode):
@@ -312,33 +292,15 @@ class ObsMode(ColorMode):
         """
         Plots application's residuals in proper color scheme.
         """
+        self.plotGroups()
+
+    def makeGroups(self):
         obsmap = self.get_obs_mapping()
-        alltoas = self.application.psr.all_toas
-        for obs, ourobs in obsmap.items():
-            # group toa indices by observatory
-            toas = alltoas.get_obss() == obs
-            color = self.obs_colors[ourobs]
-            if self.application.yerrs is None:
-                self.application.plkAxes.scatter(
-                    self.application.xvals[toas],
-                    self.application.yvals[toas],
-                    marker=".",
-                    color=color,
-                )
-            else:
-                self.application.plotErrorbar(toas, color=color)
-        # Now handle the selected TOAs
-        if self.application.yerrs is None:
-            self.application.plkAxes.scatter(
-                self.application.xvals[self.application.selected],
-                self.application.yvals[self.application.selected],
-                marker=".",
-                color=self.selected_color,
-            )
-        else:
-            self.application.plotErrorbar(
-                self.application.selected, color=self.selected_color
-            )
+        # group toa indices by observatory
+        obss = self.application.psr.all_toas.get_obss()
+        return [
+            (obss == obs, self.obs_colors[ourobs]) for obs, ourobs in obsmap.items()
+        ]
 
 
 class JumpMode(ColorMode):
@@ -395,22 +357,10 @@ class JumpMode(ColorMode):
             # group toa indices by jump
             if self.application.yerrs is None:
                 self.application.plkAxes.scatter(
-                    self.application.xvals[toas],
-                    self.application.yvals[toas],
+                    self.application.xvalsValue[toas],
+                    self.application.yvalsValue[toas],
                     marker=".",
                     color=color_name,
                 )
             else:
                 self.application.plotErrorbar(toas, color=color_name)
-        # Now handle the selected TOAs
-        if self.application.yerrs is None:
-            self.application.plkAxes.scatter(
-                self.application.xvals[self.application.selected],
-                self.application.yvals[self.application.selected],
-                marker=".",
-                color=self.selected_color,
-            )
-        else:
-            self.application.plotErrorbar(
-                self.application.selected, color=self.selected_color
-            )
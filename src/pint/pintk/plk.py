@@ -4,6 +4,7 @@ Interactive emulator of tempo2 plk
 import copy
 import os
 import sys
+import time
 
 from astropy.time import Time
 import astropy.units as u
@@ -11,6 +12,7 @@ import matplotlib as mpl
 import numpy as np
 import matplotlib.figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.collections import LineCollection
 
 import pint.pintk.pulsar as pulsar
 import pint.pintk.colormodes as cm
@@ -80,6 +82,10 @@ space           Print info about highlighted points (or all, if none are selecte
 """
 
 clickDist = 0.0005
+# minimum time (in s) between redraws of the selection rectangle while dragging
+dragRedrawTime = 1 / 30
+# with at least this many TOAs, the points are rasterized when saving to vector formats
+rasterizeNumTOAs = 5000
 
 # wideband and narrowband fitter options
 wb_fitters = [
@@ -102,10 +108,31 @@ foreground = "black"
 background = "#E9E9E9"
 
 
+def clearedMask(mask, ntoas):
+    """Return a boolean mask of ntoas False values, reusing mask if it is that long"""
+    if mask is None or len(mask) != ntoas:
+        return np.zeros(ntoas, dtype=bool)
+    mask.fill(False)
+    return mask
+
+
+def paddedRange(low, high):
+    """Return the axis limits spanning the values low to high, with 10% padding"""
+    low, high = np.min(low), np.max(high)
+    ave = 0.5 * (high + low)
+    return ave - 1.10 * (ave - low), ave + 1.10 * (high - ave)
+
+
 class State:
     """class used by revert to save the state of the system before each fit"""
 
-    pass
+    @classmethod
+    def snapshot(cls, psr, selected):
+        """Save a copy of the pulsar and the selection that later changes won't touch"""
+        state = cls()
+        state.psr = copy.deepcopy(psr)
+        state.selected = selected.copy()
+        return state
 
 
 class CreateToolTip:
@@ -115,6 +142,9 @@ class CreateToolTip:
     From this page:  https://stackoverflow.com/questions/3221956/how-do-i-display-tooltips-in-tkinter
     """
 
+    # all tooltips are shown in the same window, which is hidden rather than destroyed
+    _window = None
+
     def __init__(self, widget, text="widget info"):
         self.waittime = 500  # milliseconds
         self.wraplength = 180  # pixels
@@ -148,27 +178,41 @@ class CreateToolTip:
         x, y, cx, cy = self.widget.bbox("insert")
         x += self.widget.winfo_rootx() + 25
         y += self.widget.winfo_rooty() + 20
+        self.tw = self.sharedWindow(self.widget)
+        self.tw.wm_geometry("+%d+%d" % (x, y))
+        self.tw.label.configure(text=self.text, wraplength=self.wraplength)
+        self.tw.deiconify()
+
+    def hidetip(self):
+        tw = self.tw
+        self.tw = None
+        if tw:
+            tw.withdraw()
+
+    @classmethod
+    def sharedWindow(cls, widget):
+        """Return the tooltip window, creating it the first time it is needed"""
+        try:
+            if cls._window is not None and cls._window.winfo_exists():
+                return cls._window
+        except tk.TclError:
+            # the application it belonged to has been destroyed
+            pass
         # creates a toplevel window
-        self.tw = tk.Toplevel(self.widget)
+        tw = tk.Toplevel(widget.winfo_toplevel())
         # Leaves only the label and removes the app window
-        self.tw.wm_overrideredirect(True)
-        self.tw.wm_geometry("+%d+%d" % (x, y))
-        label = tk.Label(
-            self.tw,
-            text=self.text,
+        tw.wm_overrideredirect(True)
+        tw.withdraw()
+        tw.label = tk.Label(
+            tw,
             justify="left",
             background="#ffffff",
             relief="solid",
             borderwidth=1,
-            wraplength=self.wraplength,
         )
-        label.pack(ipadx=1)
-
-    def hidetip(self):
-        tw = self.tw
-        self.tw = None
-        if tw:
-            tw.destroy()
+        tw.label.pack(ipadx=1)
+        cls._window = tw
+        return tw
 
 
 class PlkFitBoxesWidget(tk.Frame):
@@ -181,6 +225,11 @@ class PlkFitBoxesWidget(tk.Frame):
         self.configure(bg=background)
         self.boxChecked = None
         self.maxcols = 8
+        # checkboxes (and their variables) by component and parameter name
+        self.compPool = {}
+        self.parPool = {}
+        # grid (row, column) of each checkbox currently shown
+        self.layout = {}
 
     def setCallbacks(self, boxChecked):
         """
@@ -191,9 +240,10 @@ class PlkFitBoxesWidget(tk.Frame):
     def addFitCheckBoxes(self, model):
         """
         Add the fitting checkboxes for the given model to the frame
-        """
-        self.deleteFitCheckBoxes()
 
+        Checkboxes are kept between calls and reused for the same component
+        or parameter; only those no longer in the model are destroyed.
+        """
         self.compGrids = []
         self.compCBs = []
         self.compVisible = []
@@ -201,7 +251,8 @@ class PlkFitBoxesWidget(tk.Frame):
 
         ii = 0
         comps = model.components.keys()
-        fitparams = [p for p in model.params if not getattr(model, p).frozen]
+        # a set, as it is checked for every parameter shown
+        fitparams = {p for p in model.params if not getattr(model, p).frozen}
         for comp in comps:
             showpars = [
                 p
@@ -214,31 +265,42 @@ class PlkFitBoxesWidget(tk.Frame):
             if not showpars:
                 continue
 
-            self.compVisible.append(tk.IntVar())
-            self.compCBs.append(
-                tk.Checkbutton(
-                    self,
-                    text=comp,
-                    variable=self.compVisible[ii],
-                    command=self.updateLayout,
-                    fg=foreground,
-                    bg=background,
+            if comp not in self.compPool:
+                var = tk.IntVar()
+                self.compPool[comp] = (
+                    tk.Checkbutton(
+                        self,
+                        text=comp,
+                        variable=var,
+                        command=self.updateLayout,
+                        fg=foreground,
+                        bg=background,
+                    ),
+                    var,
                 )
-            )
+            compCB, var = self.compPool[comp]
+            compCB.deselect()
+            self.compVisible.append(var)
+            self.compCBs.append(compCB)
 
             self.compGrids.append([])
             for pp, par in enumerate(showpars):
-                self.parVars[par] = tk.IntVar()
-                self.compGrids[ii].append(
-                    tk.Checkbutton(
-                        self,
-                        text=par,
-                        variable=self.parVars[par],
-                        command=lambda p=par: self.changedFitCheckBox(p),
-                        bg=background,
-                        fg=foreground,
+                if par not in self.parPool:
+                    var = tk.IntVar()
+                    self.parPool[par] = (
+                        tk.Checkbutton(
+                            self,
+                            text=par,
+                            variable=var,
+                            command=lambda p=par: self.changedFitCheckBox(p),
+                            bg=background,
+                            fg=foreground,
+                        ),
+                        var,
                     )
-                )
+                parCB, self.parVars[par] = self.parPool[par]
+                parCB.deselect()
+                self.compGrids[ii].append(parCB)
                 if par in fitparams:
                     # default DispersionDMX to off so graph not overwhelmed by parameters
                     if comp != "DispersionDMX":
@@ -246,33 +308,61 @@ class PlkFitBoxesWidget(tk.Frame):
                     self.compGrids[ii][pp].select()
             ii += 1
 
+        self.deleteUnusedCheckBoxes()
         self.updateLayout()
 
+    def deleteUnusedCheckBoxes(self):
+        """Destroy the checkboxes of components and parameters no longer shown"""
+        for name in set(self.compPool) - {cb["text"] for cb in self.compCBs}:
+            self.destroyCheckBox(self.compPool.pop(name)[0])
+        for name in set(self.parPool) - set(self.parVars):
+            self.destroyCheckBox(self.parPool.pop(name)[0])
+
+    def destroyCheckBox(self, widget):
+        self.layout.pop(widget, None)
+        widget.destroy()
+
     def deleteFitCheckBoxes(self):
         for widget in self.winfo_children():
             widget.destroy()
+        self.compPool = {}
+        self.parPool = {}
+        self.layout = {}
 
     def clear_grid(self):
         for widget in self.winfo_children():
             widget.grid_forget()
+        self.layout = {}
 
     def updateLayout(self):
-        self.clear_grid()
+        """
+        Grid the checkboxes of the components, and the parameters of the visible ones
+
+        Only checkboxes that appear, move or disappear are (un)gridded.
+        """
+        layout = {}
         rowCount = 0
         for ii in range(len(self.compGrids)):
-            self.compCBs[ii].grid(row=rowCount, column=0, sticky="W")
+            layout[self.compCBs[ii]] = (rowCount, 0)
             if self.compVisible[ii].get():
                 for pp, cb in enumerate(self.compGrids[ii]):
                     row = int(pp / self.maxcols)
                     col = pp % self.maxcols + 1
-                    cb.grid(row=rowCount + row, column=col, sticky="W")
+                    layout[cb] = (rowCount + row, col)
                 rowCount += int(len(self.compGrids[ii]) / self.maxcols)
             rowCount += 1
 
+        for widget in self.layout.keys() - layout.keys():
+            widget.grid_forget()
+        for widget, (row, col) in layout.items():
+            if self.layout.get(widget) != (row, col):
+                widget.grid(row=row, column=col, sticky="W")
+        self.layout = layout
+
     def changedFitCheckBox(self, par):
         if self.boxChecked is not None:
             self.boxChecked(par, bool(self.parVars[par].get()))
-        log.info(f'{par} will {"" if self.parVars[par].get() else "not "}be fit')
+        log.info("{} will {}be fit", par, "" if self.parVars[par].get() else "not ")
 
 
 class PlkRandomModelSelect(tk.Frame):
@@ -678,7 +768,19 @@ class PlkWidget(tk.Frame):
         self.update_callbacks = None
         self.press = False
         self.move = False
+        self.lastDragDraw = 0.0
+        self.toolbarUpdatePending = False
         self.psr = None
+        # boolean arrays, len = all_toas, True = selected/jumped
+        self.selected = None
+        self.jumped = None
+        # data for each plot label, with the pulsar state it was computed from
+        self.psrDataCache = {}
+        self.residualsUnitCache = None
+        # the jump masks, with the TOA table and jump flags they were made from
+        self.jumpMasksCache = None
+        # the values, residuals and errors the plotted arrays were made from
+        self.plotValuesSource = None
         self.color_modes = [
             cm.DefaultMode(self),
             cm.FreqMode(self),
@@ -686,6 +788,7 @@ class PlkWidget(tk.Frame):
             cm.NameMode(self),
             cm.JumpMode(self),
         ]
+        self.color_modes_by_name = {mode.mode_name: mode for mode in self.color_modes}
         self.current_mode = "default"
 
     def initPlk(self):
@@ -704,6 +807,12 @@ class PlkWidget(tk.Frame):
         self.plkCanvas.mpl_connect("button_release_event", self.canvasReleaseEvent)
         self.plkCanvas.mpl_connect("motion_notify_event", self.canvasMotionEvent)
         self.plkCanvas.mpl_connect("key_press_event", self.canvasKeyEvent)
+        self.plkCanvas.mpl_connect("draw_event", self.canvasDrawEvent)
+        # The selected TOAs are drawn separately from the rest of the plot so
+        # that (un)selecting TOAs only needs to blit them over the background
+        self.selectedPlot = None
+        self.selectedArtists = []
+        self.plkBackground = None
         self.plkToolbar = PlkToolbar(self.plkCanvas, tk.Frame(self))
         # This makes the "Home" button reset the plot just like the 'k' key
         self.plkToolbar.children["!button"].config(command=self.updatePlot)
@@ -746,8 +855,7 @@ class PlkWidget(tk.Frame):
     def update(self):
         if self.psr is not None:
             self.psr.update_resids()
-            self.selected = np.zeros(self.psr.all_toas.ntoas, dtype=bool)
-            self.jumped = np.zeros(self.psr.all_toas.ntoas, dtype=bool)
+            self.clearMasks()
             self.actionsWidget.setFitButtonText("Fit")
             self.fitboxesWidget.addFitCheckBoxes(self.psr.prefit_model)
             self.randomboxWidget.addRandomCheckbox(self)
@@ -755,24 +863,20 @@ class PlkWidget(tk.Frame):
             self.fitterWidget.updateFitterChoices(self.psr.all_toas.wideband)
             self.xyChoiceWidget.setChoice()
             self.updatePlot(keepAxes=True)
-            self.plkToolbar.update()
+            self.updateToolbar()
             # reset state stack
             self.state_stack = [self.base_state]
             self.current_state = State()
 
     def setPulsar(self, psr, updates):
         self.psr = psr
-        # self.selected & self.jumped = boolean arrays, len = all_toas, True = selected/jumped
-        self.selected = np.zeros(self.psr.all_toas.ntoas, dtype=bool)
-        self.jumped = np.zeros(self.psr.all_toas.ntoas, dtype=bool)
+        self.clearMasks()
         # update jumped with any jump params already in the file
         self.updateAllJumped()
         self.update_callbacks = updates
 
         if not hasattr(self, "base_state"):
-            self.base_state = State()
-            self.base_state.psr = copy.deepcopy(self.psr)
-            self.base_state.selected = copy.deepcopy(self.selected)
+            self.base_state = State.snapshot(self.psr, self.selected)
             self.state_stack.append(self.base_state)
 
         self.fitboxesWidget.setCallbacks(self.fitboxChecked)
@@ -794,8 +898,27 @@ class PlkWidget(tk.Frame):
         )
         self.fitterWidget.fitter = self.psr.fit_method
         self.updatePlot(keepAxes=False)
+        self.updateToolbar()
+
+    def updateToolbar(self):
+        """
+        Reset the toolbar (e.g. its view history) once the event loop is idle
+
+        Several updates of the pulsar in a row then only reset it once.
+        """
+        if not self.toolbarUpdatePending:
+            self.toolbarUpdatePending = True
+            self.after_idle(self.flushToolbarUpdate)
+
+    def flushToolbarUpdate(self):
+        self.toolbarUpdatePending = False
         self.plkToolbar.update()
 
+    def clearMasks(self):
+        """Unselect and unjump all TOAs, reusing the arrays if the number of TOAs is unchanged"""
+        self.selected = clearedMask(self.selected, self.psr.all_toas.ntoas)
+        self.jumped = clearedMask(self.jumped, self.psr.all_toas.ntoas)
+
     def call_updates(self, psr_update=False):
         if self.update_callbacks is not None:
             for ucb in self.update_callbacks:
@@ -805,6 +928,9 @@ class PlkWidget(tk.Frame):
                     ucb()
 
     def updateGraphColors(self, color_mode):
+        # clicking the current mode again changes nothing (the axes are kept)
+        if color_mode == self.current_mode:
+            return
         self.current_mode = color_mode
         self.updatePlot(keepAxes=True)
 
@@ -821,15 +947,18 @@ class PlkWidget(tk.Frame):
         if parchanged.startswith("JUMP"):
             self.updateJumped(parchanged)
         self.call_updates()
-        self.updatePlot(keepAxes=True)
+        # only jumps change what is drawn (the jumped TOAs); the data are not
+        # recomputed until the next fit, so there is nothing else to redraw
+        if parchanged.startswith("JUMP"):
+            self.updatePlot(keepAxes=True)
 
     def unselect(self):
         """
         Undo a selection (but not deletes)
         """
-        self.psr.selected_toas = copy.deepcopy(self.psr.all_toas)
-        self.selected = np.zeros(self.psr.selected_toas.ntoas, dtype=bool)
-        self.updatePlot(keepAxes=True)
+        self.psr.selected_toas = pulsar.copy_TOAs(self.psr.all_toas)
+        self.selected = clearedMask(self.selected, self.psr.selected_toas.ntoas)
+        self.updateSelected()
         self.call_updates()
 
     def fit(self):
@@ -842,21 +971,18 @@ class PlkWidget(tk.Frame):
                 return None
             if self.psr.fitted:
                 # append the current state to the state stack
-                self.current_state.psr = copy.deepcopy(self.psr)
-                self.current_state.selected = self.selected
-                self.state_stack.append(copy.deepcopy(self.current_state))
+                self.state_stack.append(State.snapshot(self.psr, self.selected))
             self.psr.fit_method = self.fitterWidget.fitter
             self.psr.fit(self.selected)
             if self.randomboxWidget.getRandomModel():
                 self.psr.random_models(self.selected)
-            self.current_state.selected = copy.deepcopy(self.selected)
+            self.current_state.selected = self.selected.copy()
             self.actionsWidget.setFitButtonText("Re-fit")
             self.fitboxesWidget.addFitCheckBoxes(self.psr.prefit_model)
             self.randomboxWidget.addRandomCheckbox(self)
             self.colorModeWidget.addColorModeCheckbox(self.color_modes)
             xid, yid = self.xyChoiceWidget.plotIDs()
             self.xyChoiceWidget.setChoice(xid=xid, yid="post-fit")
-            self.jumped = np.zeros(self.psr.all_toas.ntoas, dtype=bool)
             self.updateAllJumped()
             self.updatePlot(keepAxes=False)
         self.call_updates()
@@ -869,8 +995,7 @@ class PlkWidget(tk.Frame):
         self.psr.reset_TOAs()
         self.psr.fitted = False
         self.psr = copy.deepcopy(self.base_state.psr)
-        self.selected = np.zeros(self.psr.all_toas.ntoas, dtype=bool)
-        self.jumped = np.zeros(self.psr.all_toas.ntoas, dtype=bool)
+        self.clearMasks()
         self.updateAllJumped()
         self.actionsWidget.setFitButtonText("Fit")
         self.fitboxesWidget.addFitCheckBoxes(self.base_state.psr.prefit_model)
@@ -878,7 +1003,7 @@ class PlkWidget(tk.Frame):
         self.colorModeWidget.addColorModeCheckbox(self.color_modes)
         self.xyChoiceWidget.setChoice()
         self.updatePlot(keepAxes=False)
-        self.plkToolbar.update()
+        self.updateToolbar()
         self.current_state = State()
         self.state_stack = [self.base_state]
         self.call_updates(psr_update=True)
@@ -909,11 +1034,15 @@ class PlkWidget(tk.Frame):
         """
         Write the current timfile to a file
         """
-        # remove jump flags from toas (don't want model-specific jumps being saved)
-        for dict in self.psr.all_toas.table["flags"]:
-            if "jump" in dict.keys():
-                del dict["jump"]
         filename = tkFileDialog.asksaveasfilename(title="Choose output tim file")
+        # leave out the jump flags (don't want model-specific jumps being saved),
+        # but keep them on the toas: only the flags that have one are swapped
+        # for copies without it while writing
+        flags = self.psr.all_toas.table["flags"]
+        jumped = [i for i, dict in enumerate(flags) if "jump" in dict]
+        saved = [flags[i] for i in jumped]
+        for i, dict in zip(jumped, saved):
+            flags[i] = {k: v for k, v in dict.items() if k != "jump"}
         try:
             log.info(f"Choose output file {filename}")
             self.psr.all_toas.write_TOA_file(filename, format=format)
@@ -923,6 +1052,9 @@ class PlkWidget(tk.Frame):
                 print("Write Tim cancelled.")
             else:
                 log.error(f"Could not save file to filename:\t{filename}")
+        finally:
+            for i, dict in zip(jumped, saved):
+                flags[i] = dict
 
     def revert(self):
         """
@@ -964,76 +1096,166 @@ class PlkWidget(tk.Frame):
             if x is not None and y is not None:
                 self.xvals = x
                 self.yvals = y
-                if "fit" in self.yid and not hasattr(self, "y_unit"):
-                    ymin, ymax = self.determine_yaxis_units(miny=y.min(), maxy=y.max())
-                    self.y_unit = ymin.unit
-                    self.yvals = self.yvals.to(self.y_unit)
-                    self.yerrs = self.yerrs.to(self.y_unit)
+                if "fit" in self.yid:
+                    if not hasattr(self, "y_unit"):
+                        ymin, ymax = self.determine_yaxis_units(
+                            miny=y.min(), maxy=y.max()
+                        )
+                        self.y_unit = ymin.unit
+                    self.yvals, self.yerrs = self.residualsInUnit(y, self.yerrs)
                 self.plotResiduals(keepAxes=keepAxes)
             else:
                 raise ValueError("Nothing to plot!")
 
         self.plkFig.tight_layout()
-        self.plkCanvas.draw()
+        # Redraw once the event loop is idle, so that a burst of updates is
+        # only drawn once; until then there is no valid background to blit on
+        self.plkBackground = None
+        self.plkCanvas.draw_idle()
+
+    def residualsInUnit(self, resids, errors):
+        """
+        The residuals and their errors converted to the y axis unit
+
+        The conversion is kept until the residuals (which are cached by
+        psr_data_from_label) or the unit change, so redrawing doesn't redo it.
+        """
+        key = (resids, errors, self.y_unit)
+        if self.residualsUnitCache is not None and all(
+            c is k for c, k in zip(self.residualsUnitCache[0], key)
+        ):
+            return self.residualsUnitCache[1]
+        converted = (resids.to(self.y_unit), errors.to(self.y_unit))
+        self.residualsUnitCache = (key, converted)
+        return converted
+
+    def updatePlotValues(self):
+        """
+        Keep the plotted values as plain arrays (the y errors in the units of
+        the y values), so plotting subsets of the TOAs doesn't need astropy units
+
+        The arrays are only remade when the values are replaced.
+        """
+        source = (self.xvals, self.yvals, self.yerrs)
+        if self.plotValuesSource is not None and all(
+            c is s for c, s in zip(self.plotValuesSource, source)
+        ):
+            return
+        self.plotValuesSource = source
+        self.xvalsValue = np.asarray(self.xvals.value)
+        self.yvalsValue = np.asarray(self.yvals.value)
+        if self.yerrs is None:
+            self.yerrsValue = None
+        else:
+            self.yerrsValue = np.asarray(self.yerrs.to_value(self.yvals.unit))
 
     def plotErrorbar(self, selected, color):
         """
         For some reason, xvals will not plot unless unitless.
         Tried using quantity_support and time_support, which plots x & yvals,
         but then yerrs fails - cannot find work-around in this case.
-        """
 
-        self.plkAxes.errorbar(
-            self.xvals[selected].value,
-            self.yvals[selected],
-            yerr=self.yerrs[selected],
+        selected can be a boolean mask or an array of indices.
+        """
+        # find the selected indices once, rather than for each array
+        selected = np.asarray(selected)
+        if selected.dtype == bool:
+            selected = np.flatnonzero(selected)
+        return self.plkAxes.errorbar(
+            self.xvalsValue[selected],
+            self.yvalsValue[selected],
+            yerr=self.yerrsValue[selected],
             fmt=".",
             color=color,
         )
 
+    def plotSelected(self):
+        """
+        Plot the selected TOAs on top of the others, in the color mode's color
+
+        These are animated artists: they are left out of the normal draws of
+        the figure and drawn over the saved background instead.  Once made,
+        they are moved to each new selection rather than made again.
+        """
+        if self.selectedPlot is not None:
+            selected = np.flatnonzero(self.selected)
+            x = self.xvalsValue[selected]
+            y = self.yvalsValue[selected]
+            if self.yerrs is None:
+                self.selectedPlot.set_offsets(np.column_stack((x, y)))
+            else:
+                yerr = self.yerrsValue[selected]
+                line, _, (bars,) = self.selectedPlot
+                line.set_data(x, y)
+                bars.set_segments(
+                    np.stack(
+                        (
+                            np.column_stack((x, y - yerr)),
+                            np.column_stack((x, y + yerr)),
+                        ),
+                        axis=1,
+                    )
+                )
+            return
+        color = self.color_modes_by_name[self.current_mode].selected_color
+        if self.yerrs is None:
+            self.selectedPlot = self.plkAxes.scatter(
+                self.xvalsValue[self.selected],
+                self.yvalsValue[self.selected],
+                marker=".",
+                color=color,
+            )
+            self.selectedArtists = [self.selectedPlot]
+        else:
+            self.selectedPlot = self.plotErrorbar(self.selected, color=color)
+            self.selectedArtists = self.selectedPlot.get_children()
+        for artist in self.selectedArtists:
+            artist.set_animated(True)
+
+    def updateSelected(self):
+        """
+        Redraw only the selected TOAs, blitting them over the saved background
+        """
+        self.plotSelected()
+        if self.plkBackground is None:
+            self.plkCanvas.draw_idle()
+            return
+        self.plkCanvas.restore_region(self.plkBackground)
+        for artist in self.selectedArtists:
+            self.plkFig.draw_artist(artist)
+        self.plkCanvas.blit(self.plkFig.bbox)
+
     def plotResiduals(self, keepAxes=False):
         """
         Update the plot, given all the plotting info
         """
+        # the residuals are already in self.y_unit (see updatePlot)
+        self.updatePlotValues()
         if keepAxes:
             xmin, xmax = self.plkAxes.get_xlim()
             ymin, ymax = self.plkAxes.get_ylim()
         else:
-            xave = 0.5 * (np.max(self.xvals) + np.min(self.xvals))
-            xmin = xave - 1.10 * (xave - np.min(self.xvals))
-            xmax = xave + 1.10 * (np.max(self.xvals) - xave)
-            if self.yerrs is None:
-                yave = 0.5 * (np.max(self.yvals) + np.min(self.yvals))
-                ymin = yave - 1.10 * (yave - np.min(self.yvals))
-                ymax = yave + 1.10 * (np.max(self.yvals) - yave)
+            xmin, xmax = paddedRange(self.xvalsValue, self.xvalsValue)
+            if self.yerrsValue is None:
+                ymin, ymax = paddedRange(self.yvalsValue, self.yvalsValue)
             else:
-                yave = 0.5 * (
-                    np.max(self.yvals + self.yerrs) + np.min(self.yvals - self.yerrs)
+                ymin, ymax = paddedRange(
+                    self.yvalsValue - self.yerrsValue, self.yvalsValue + self.yerrsValue
                 )
-                ymin = yave - 1.10 * (yave - np.min(self.yvals - self.yerrs))
-                ymax = yave + 1.10 * (np.max(self.yvals + self.yerrs) - yave)
-            xmin, xmax = xmin.value, xmax.value
-
-        # determine if y-axis units need scaling and scale accordingly
-        if "fit" in self.yid:
-            # ymin, ymax = self.determine_yaxis_units(miny=ymin, maxy=ymax)
-            # self.y_unit = ymin.unit
-            if type(self.yvals) == u.quantity.Quantity:
-                self.yvals = self.yvals.to(self.y_unit)
-            if type(ymin) == u.quantity.Quantity:
-                ymin, ymax = ymin.to(self.y_unit).value, ymax.to(self.y_unit).value
-        else:
-            if type(ymin) == u.quantity.Quantity:
-                ymin, ymax = ymin.value, ymax.value
 
         self.plkAxes.clear()
         self.plkAx2x.clear()
         self.plkAx2y.clear()
+        self.selectedPlot = None
+        self.selectedArtists = []
         self.plkAxes.grid(True)
         # plot residuals in appropriate color scheme
-        for mode in self.color_modes:
-            if self.current_mode == mode.mode_name:
-                mode.plotColorMode()
+        self.color_modes_by_name[self.current_mode].plotColorMode()
+        if len(self.xvalsValue) >= rasterizeNumTOAs:
+            # one image rather than thousands of paths in saved PDF/SVG files
+            for artist in self.plkAxes.lines + self.plkAxes.collections:
+                artist.set_rasterized(True)
+        self.plotSelected()
         self.plkAxes.axis([xmin, xmax, ymin, ymax])
         self.plkAxes.get_xaxis().get_major_formatter().set_useOffset(False)
         self.plkAx2y.set_visible(False)
@@ -1044,15 +1266,11 @@ class PlkWidget(tk.Frame):
 
         if self.xid in ["pre-fit", "post-fit"]:
             self.plkAxes.set_xlabel(plotlabels[self.xid][0])
-            m = (
-                self.psr.prefit_model
-                if self.xid == "pre-fit" or not self.psr.fitted
-                else self.psr.postfit_model
-            )
+            m = self.labelModel(self.xid)
             if hasattr(m, "F0"):
                 self.plkAx2y.set_visible(True)
                 self.plkAx2y.set_xlabel(plotlabels[self.xid][1])
-                f0 = m.F0.quantity.to(u.MHz).value
+                f0 = m.F0.quantity.to_value(u.MHz)
                 self.plkAx2y.set_xlim(xmin * f0, xmax * f0)
                 self.plkAx2y.xaxis.set_major_locator(
                     mpl.ticker.FixedLocator(self.plkAxes.get_xticks() * f0)
@@ -1065,17 +1283,9 @@ class PlkWidget(tk.Frame):
                 plotlabels[self.yid][0] + " (" + str(self.y_unit) + ")"
             )
             try:
-                r = (
-                    self.psr.prefit_resids
-                    if self.yid == "pre-fit" or not self.psr.fitted
-                    else self.psr.postfit_resids
-                )
-                if self.y_unit == u.us:
-                    f0 = r.get_PSR_freq().to(u.MHz).value
-                elif self.y_unit == u.ms:
-                    f0 = r.get_PSR_freq().to(u.kHz).value
-                else:
-                    f0 = r.get_PSR_freq().to(u.Hz).value
+                r = self.labelResids(self.yid)
+                # MHz for us, kHz for ms and Hz for s
+                f0 = r.get_PSR_freq().to_value(1 / self.y_unit)
                 self.plkAx2x.set_visible(True)
                 self.plkAx2x.set_ylabel(plotlabels[self.yid][1])
                 self.plkAx2x.set_ylim(ymin * f0, ymax * f0)
@@ -1086,11 +1296,7 @@ class PlkWidget(tk.Frame):
                 pass
             # If fitting orbital phase, plot the conjunction
             if self.xid == "orbital phase":
-                m = (
-                    self.psr.prefit_model
-                    if self.xid == "pre-fit" or not self.psr.fitted
-                    else self.psr.postfit_model
-                )
+                m = self.labelModel(self.xid)
                 if m.is_binary:
                     print(
                         "The black vertical line is when superior conjunction occurs."
@@ -1113,36 +1319,46 @@ class PlkWidget(tk.Frame):
             # look at axes, allow random models to plot on x-axes other than MJD
             xid, yid = self.xyChoiceWidget.plotIDs()
             if xid == "year":
-                t = Time(f_toas.get_mjds(), format="mjd")
-                f_toas_plot = np.asarray(t.decimalyear) << u.year
+                f_toas_plot = Time(f_toas.get_mjds(), format="mjd").decimalyear
             else:
-                f_toas_plot = f_toas.get_mjds()
-            scale = 1
-            if self.yvals.unit == u.us:
-                scale = 10**6
-            elif self.yvals.unit == u.ms:
-                scale = 10**3
+                f_toas_plot = f_toas.get_mjds().value
+            unit = self.yvals.unit if self.yvals.unit in [u.us, u.ms] else u.s
             # Want to plot things in sorted order so that lines are smooth
             sort_inds = np.argsort(f_toas_plot)
-            f_toas_plot = f_toas_plot[sort_inds]
-            for i in range(len(rs)):
-                self.plkAxes.plot(
-                    f_toas_plot, rs[i][sort_inds] * scale, "-k", alpha=0.3
-                )
+            # convert and sort all of the models at once, and draw them as
+            # one collection of lines rather than a line for each
+            x, y = np.broadcast_arrays(
+                f_toas_plot[sort_inds], rs.to_value(unit)[:, sort_inds]
+            )
+            self.plkAxes.add_collection(
+                LineCollection(np.stack((x, y), axis=-1), colors="k", alpha=0.3)
+            )
+
+    def labelModel(self, label):
+        """Return the model for a plot label: pre-fit for "pre-fit" or before a fit"""
+        if label == "pre-fit" or not self.psr.fitted:
+            return self.psr.prefit_model
+        return self.psr.postfit_model
+
+    def labelResids(self, label):
+        """Return the residuals for a plot label: pre-fit for "pre-fit" or before a fit"""
+        if label == "pre-fit" or not self.psr.fitted:
+            return self.psr.prefit_resids
+        return self.psr.postfit_resids
 
     def determine_yaxis_units(self, miny, maxy):
         """Checks range of residuals and converts units if range sufficiently large/small."""
-        diff = maxy - miny
-        if diff > 0.2 * u.s:
-            maxy = maxy.to(u.s)
-            miny = miny.to(u.s)
-        elif diff > 0.2 * u.ms:
-            maxy = maxy.to(u.ms)
-            miny = miny.to(u.ms)
-        elif diff <= 0.2 * u.ms:
-            maxy = maxy.to(u.us)
-            miny = miny.to(u.us)
-        return miny, maxy
+        # compare the range in seconds as a plain number
+        diff = (maxy - miny).to_value(u.s)
+        if diff > 0.2:
+            unit = u.s
+        elif diff > 0.2e-3:
+            unit = u.ms
+        elif diff <= 0.2e-3:
+            unit = u.us
+        else:
+            return miny, maxy
+        return miny.to(unit), maxy.to(unit)
 
     def print_info(self):
         """
@@ -1159,21 +1375,21 @@ class PlkWidget(tk.Frame):
         print(header)
         print("-" * (len(header) + 8))
 
-        xs = self.xvals[selected].value
-        ys = self.yvals[selected].value
-        inds = self.psr.all_toas.table["index"][selected]
-        obss = self.psr.all_toas.table["obs"][selected]
-        freqs = self.psr.all_toas.table["freq"][selected]
-        errors = self.psr.all_toas.table["error"][selected]
-        MJDs = self.psr.all_toas.table["mjd_float"][selected]
-        flags = self.psr.all_toas.table["flags"][selected]
-
-        for x, y, ind, obs, freq, err, MJD, flag in zip(
-            xs, ys, inds, obss, freqs, errors, MJDs, flags
-        ):
-            print(
+        # plain Python values format much faster than numpy scalars, and
+        # the rows are printed all at once rather than one by one
+        table = self.psr.all_toas.table
+        columns = [
+            self.xvalsValue[selected].tolist(),
+            self.yvalsValue[selected].tolist(),
+        ]
+        for name in ["index", "obs", "freq", "error", "mjd_float", "flags"]:
+            columns.append(np.asarray(table[name])[selected].tolist())
+        print(
+            "\n".join(
                 f"{x:^10.4f} {y:^10.4f} {ind:^7} {obs:^7} {freq:^11.4f} {err:^11.3f} {MJD:^20.15f} {flag}"
+                for x, y, ind, obs, freq, err, MJD, flag in zip(*columns)
             )
+        )
         self.print_chi2()
 
     def print_chi2(self):
@@ -1182,10 +1398,49 @@ class PlkWidget(tk.Frame):
         selected = self.selected if np.sum(self.selected) else ~self.selected
         self.psr.print_chi2(selected)
 
+    def psrDataState(self):
+        """
+        The pulsar objects that the plotted data are computed from
+
+        These are all replaced (rather than modified) whenever the TOAs,
+        models or residuals change.
+        """
+        psr = self.psr
+        return (
+            psr,
+            psr.fitted,
+            psr.all_toas,
+            psr.all_toas.table,
+            psr.prefit_model,
+            getattr(psr, "postfit_model", None),
+            psr.prefit_resids,
+            getattr(psr, "postfit_resids", None),
+            getattr(psr, "prefit_resids_no_jumps", None),
+        )
+
     def psr_data_from_label(self, label):
         """
         Given a label, get the corresponding data from the pulsar
 
+        The data are cached until the pulsar state changes, so that redrawing
+        (e.g. for a new color mode) does not recompute them.
+
+        @param label: The label for the data we want
+        @return:    data, error
+        """
+        state = self.psrDataState()
+        if label in self.psrDataCache:
+            cached_state, cached_data = self.psrDataCache[label]
+            if all(c is s for c, s in zip(cached_state, state)):
+                return cached_data
+        data, error = self.compute_psr_data(label)
+        self.psrDataCache[label] = (state, (data, error))
+        return data, error
+
+    def compute_psr_data(self, label):
+        """
+        Compute the data for a label from the pulsar
+
         @param label: The label for the data we want
         @return:    data, error
         """
@@ -1212,7 +1467,7 @@ class PlkWidget(tk.Frame):
             data = self.psr.orbitalphase()
             error = None
         elif label == "serial":
-            data = np.arange(self.psr.all_toas.ntoas) * u.m / u.m
+            data = np.arange(self.psr.all_toas.ntoas) << u.dimensionless_unscaled
             error = None
         elif label == "day of year":
             data = self.psr.dayofyear()
@@ -1237,14 +1492,27 @@ class PlkWidget(tk.Frame):
         """
         ind = None
         if self.psr is not None:
-            x = self.xvals.value
-            y = self.yvals.value
+            x = self.xvalsValue
+            y = self.yvalsValue
             xmin, xmax, ymin, ymax = self.plkAxes.axis()
-            dist = ((x - cx) / (xmax - xmin)) ** 2.0 + ((y - cy) / (ymax - ymin)) ** 2.0
+            # squared distance in axis units, worked out in place so that only
+            # two arrays are made however many TOAs there are
+            dist = x - cx
+            dist /= xmax - xmin
+            dist *= dist
+            dy = y - cy
+            dy /= ymax - ymin
+            dy *= dy
+            dist += dy
             ind = np.argmin(dist)
+            # loguru only formats the quantities when the message is shown
             log.debug(
-                f"Closest: TOA index {self.psr.all_toas.table['index'][ind]} (plot index {ind}): "
-                f"({self.xvals[ind]:.4f}, {self.yvals[ind]:.3g}) at d={dist[ind]:.3g}"
+                "Closest: TOA index {} (plot index {}): ({:.4f}, {:.3g}) at d={:.3g}",
+                self.psr.all_toas.table["index"][ind],
+                ind,
+                self.xvals[ind],
+                self.yvals[ind],
+                dist[ind],
             )
             if dist[ind] > clickDist:
                 log.warning("Not close enough to a point")
@@ -1264,35 +1532,75 @@ class PlkWidget(tk.Frame):
             )
             return True
 
-    def updateJumped(self, jump_name):
+    def jumpFlags(self):
+        """Return the jump flag of each TOA as an array of strings ("" if none)"""
+        return np.array(
+            [dict.get("jump", "") for dict in self.psr.all_toas.table["flags"]],
+            dtype=str,
+        )
+
+    def jumpMasks(self):
+        """
+        Return a boolean mask of the TOAs in each jump, by jump number
+
+        The masks are kept until the TOA table is replaced or the pulsar
+        changes the jump flags (see Pulsar.add_jump).
+        """
+        key = (self.psr.all_toas.table, self.psr.jump_flags_version)
+        if self.jumpMasksCache is not None:
+            (table, version), masks = self.jumpMasksCache
+            if table is key[0] and version == key[1]:
+                return masks
+        names, codes = np.unique(self.jumpFlags(), return_inverse=True)
+        masks = {name: codes == ii for ii, name in enumerate(names) if name}
+        self.jumpMasksCache = (key, masks)
+        return masks
+
+    def updateJumped(self, jump_name, jump_masks=None):
         """update self.jumped for the jump given"""
         # if removing a jump, add_jump returns a boolean array rather than a name
-        if type(jump_name) == list:
+        if isinstance(jump_name, list):
             self.jumped[jump_name] = False
             return None
-        elif type(jump_name) != str:
+        elif not isinstance(jump_name, str):
             log.error(
                 jump_name,
                 "Return value for the jump name is not a string, jumps not updated",
             )
             return None
         num = jump_name[4:]  # string value
-        jump_select = [
-            ("jump" in dict and dict["jump"] == num)
-            for dict in self.psr.all_toas.table["flags"]
-        ]
-        log.info(f"JUMP{num} contains {sum(jump_select)} TOAs for fit.")
-        self.jumped[jump_select] = ~self.jumped[jump_select]
+        if jump_masks is None:
+            jump_select = self.jumpFlags() == num
+        elif num in jump_masks:
+            jump_select = jump_masks[num]
+        else:
+            jump_select = np.zeros(len(self.jumped), dtype=bool)
+        log.info(f"JUMP{num} contains {jump_select.sum()} TOAs for fit.")
+        self.jumped ^= jump_select
 
     def updateAllJumped(self):
         """Update self.jumped for all active JUMPs"""
-        self.jumped = np.zeros(self.psr.all_toas.ntoas, dtype=bool)
+        self.jumped = clearedMask(self.jumped, self.psr.all_toas.ntoas)
+        # only read the flags once for all of the jumps
+        jump_masks = self.jumpMasks()
         for param in self.psr.prefit_model.params:
             if (
                 param.startswith("JUMP")
                 and getattr(self.psr.prefit_model, param).frozen == False
             ):
-                self.updateJumped(param)
+                self.updateJumped(param, jump_masks)
+
+    def canvasDrawEvent(self, event):
+        """
+        Call this function when the figure/canvas has been drawn
+        """
+        # When saving, the axes draw the animated artists themselves
+        if event.canvas.is_saving():
+            return
+        # Keep what was drawn as the background for blitting the selection
+        self.plkBackground = self.plkCanvas.copy_from_bbox(self.plkFig.bbox)
+        for artist in self.selectedArtists:
+            artist.draw(event.renderer)
 
     def canvasClickEvent(self, event):
         """
@@ -1303,6 +1611,7 @@ class PlkWidget(tk.Frame):
         if event.inaxes == self.plkAxes:
             self.press = True
             self.pressEvent = event
+            self.lastDragDraw = 0.0
 
     def canvasMotionEvent(self, event):
         """
@@ -1310,6 +1619,12 @@ class PlkWidget(tk.Frame):
         """
         if event.inaxes == self.plkAxes and self.press:
             self.move = True
+            # Motion events can come much faster than the rectangle is worth
+            # redrawing, which would swamp the Tk event loop
+            now = time.monotonic()
+            if now - self.lastDragDraw < dragRedrawTime:
+                return
+            self.lastDragDraw = now
             # Draw bounding box
             x0, x1 = self.pressEvent.x, event.x
             y0, y1 = self.pressEvent.y, event.y
@@ -1345,7 +1660,7 @@ class PlkWidget(tk.Frame):
                     toa_ind = self.psr.all_toas.table["index"][ind]
                     sudo_select_mask = np.zeros_like(self.selected).astype(bool)
                     sudo_select_mask[ind] = True
-                    jumped_copy = copy.deepcopy(self.jumped)
+                    jumped_copy = self.jumped.copy()
                     unselect_jump_stat = jumped_copy[~sudo_select_mask]
 
                     # Check if it is jumped
@@ -1353,7 +1668,7 @@ class PlkWidget(tk.Frame):
                         # Means its jumped, so unjump it
                         jump_name = self.psr.add_jump(sudo_select_mask)
                         self.updateJumped(jump_name)
-                        if type(jump_name) != list:
+                        if not isinstance(jump_name, list):
                             log.error(f"Mistakenly added new jump {jump_name}")
                         else:
                             log.info(
@@ -1369,7 +1684,7 @@ class PlkWidget(tk.Frame):
                 if event.button == 1:
                     # Left click is select
                     self.selected[ind] = not self.selected[ind]
-                    self.updatePlot(keepAxes=True)
+                    self.updateSelected()
                     # if point is being selected (instead of unselected) or
                     # point is unselected but other points remain selected
                     if self.selected[ind] or any(self.selected):
@@ -1391,12 +1706,16 @@ class PlkWidget(tk.Frame):
                 xmin, xmax = xmax, xmin
             if ymin > ymax:
                 ymin, ymax = ymax, ymin
-            selected = (self.xvals.value > xmin) & (self.xvals.value < xmax)
-            selected &= (self.yvals.value > ymin) & (self.yvals.value < ymax)
+            # combine the four comparisons using one scratch array
+            selected = self.xvalsValue > xmin
+            inside = np.less(self.xvalsValue, xmax)
+            selected &= inside
+            selected &= np.greater(self.yvalsValue, ymin, out=inside)
+            selected &= np.less(self.yvalsValue, ymax, out=inside)
             self.selected |= selected
-            self.updatePlot(keepAxes=True)
+            self.updateSelected()
             self.plkCanvas._tkcanvas.delete(self.brect)
-            if any(self.selected):
+            if self.selected.any():
                 self.psr.selected_toas = self.psr.all_toas[self.selected]
                 self.psr.update_resids()
                 self.call_updates()
@@ -1432,11 +1751,11 @@ class PlkWidget(tk.Frame):
             self.call_updates()
             log.info("Pulse number for selected points increased.")
         elif event.key in [">", ".", "<", ","]:
-            if np.sum(self.selected) > 0:
-                later = (
-                    self.psr.selected_toas.get_mjds().max()
-                    < self.psr.all_toas.get_mjds()
-                )
+            if self.selected.any():
+                # compare the full precision times, so TOAs only a few ns
+                # apart are still told apart, without the selected TOAs
+                mjds = self.psr.all_toas.table["mjd"]
+                later = mjds > mjds[self.selected].max()
                 if event.key in [">", "."]:
                     self.psr.add_phase_wrap(later, 1)
                     log.info(
@@ -1451,7 +1770,7 @@ class PlkWidget(tk.Frame):
                 self.call_updates()
         elif event.key == "d":
             # Get the current state of jumped toas
-            jumped_copy = copy.deepcopy(self.jumped)
+            jumped_copy = self.jumped.copy()
             unselect_jump_status = jumped_copy[~self.selected]
 
             # First update the jump status and then delete them
@@ -1460,7 +1779,7 @@ class PlkWidget(tk.Frame):
                 jump_name = self.psr.add_jump(self.selected)
                 self.updateJumped(jump_name)
                 # Here jump_name has to be a list
-                if type(jump_name) != list:
+                if not isinstance(jump_name, list):
                     log.error(f"Mistakenly added new jump {jump_name}")
                 else:
                     log.info(
@@ -1482,8 +1801,8 @@ class PlkWidget(tk.Frame):
             # jump the selected points, or unjump if already jumped
             jump_name = self.psr.add_jump(self.selected)
             self.updateJumped(jump_name)
-            self.psr.selected_toas = copy.deepcopy(self.psr.all_toas)
-            self.selected = np.zeros(self.psr.selected_toas.ntoas, dtype=bool)
+            self.psr.selected_toas = pulsar.copy_TOAs(self.psr.all_toas)
+            self.selected = clearedMask(self.selected, self.psr.selected_toas.ntoas)
             self.fitboxesWidget.addFitCheckBoxes(self.psr.prefit_model)
             self.randomboxWidget.addRandomCheckbox(self)
             self.colorModeWidget.addColorModeCheckbox(self.color_modes)
@@ -1491,20 +1810,19 @@ class PlkWidget(tk.Frame):
             self.call_updates()
         elif event.key == "v":
             # jump all clusters except the one(s) selected, or jump all clusters if none selected
-            jumped_copy = copy.deepcopy(self.jumped)
+            jumped_copy = self.jumped.copy()
             self.updateAllJumped()
-            all_jumped = copy.deepcopy(self.jumped)
+            all_jumped = self.jumped.copy()
             self.jumped = jumped_copy
-            clusters = list(self.psr.all_toas.table["clusters"])
-            # jump each cluster, check doesn't overlap with existing jumps and selected
-            for num in np.arange(max(clusters) + 1):
-                cluster_bool = [
-                    num == cluster for cluster in self.psr.all_toas.table["clusters"]
-                ]
-                if True in [
-                    a and b for a, b in zip(cluster_bool, self.selected)
-                ] or True in [a and b for a, b in zip(cluster_bool, all_jumped)]:
-                    continue
+            clusters, cluster_index = np.unique(
+                self.psr.all_toas.table["clusters"], return_inverse=True
+            )
+            # jump each cluster that doesn't overlap with existing jumps and selected,
+            # finding those that do all at once
+            overlaps = np.zeros(len(clusters), dtype=bool)
+            overlaps[cluster_index[self.selected | all_jumped]] = True
+            for num in np.flatnonzero(~overlaps):
+                cluster_bool = cluster_index == num
                 self.psr.selected_toas = self.psr.all_toas[cluster_bool]
                 jump_name = self.psr.add_jump(cluster_bool)
                 self.updateJumped(jump_name)
@@ -1535,8 +1853,9 @@ class PlkWidget(tk.Frame):
                 log.debug(
                     f"Unstashing {len(self.psr.stashed)-len(self.psr.all_toas)} TOAs"
                 )
-                self.psr.all_toas = copy.deepcopy(self.psr.stashed)
-                self.selected = np.zeros(self.psr.all_toas.ntoas, dtype=bool)
+                # the stash is dropped, so its TOAs can be used without copying
+                self.psr.all_toas = self.psr.stashed
+                self.selected = clearedMask(self.selected, self.psr.all_toas.ntoas)
                 self.psr.stashed = None
                 self.updateAllJumped()
                 self.psr.update_resids()
@@ -1546,9 +1865,9 @@ class PlkWidget(tk.Frame):
                 if (
                     self.psr.stashed is None
                 ):  # if there is nothing in the stash, copy current TOAs to stash
-                    jumped_copy = copy.deepcopy(self.jumped)
+                    jumped_copy = self.jumped.copy()
                     self.updateAllJumped()
-                    all_jumped = copy.deepcopy(self.jumped)
+                    all_jumped = self.jumped.copy()
                     self.jumped = jumped_copy
                     if (self.selected & all_jumped).any():
                         # if any of the points are jumped, tell the user to delete the jump(s) first
@@ -1556,20 +1875,26 @@ class PlkWidget(tk.Frame):
                             "Cannot stash jumped TOAs. Delete interfering jumps before stashing TOAs."
                         )
                         return None
-                    log.debug(f"Stashing {sum(self.selected)} TOAs")
-                    self.psr.stashed = copy.deepcopy(self.psr.all_toas)
+                    log.opt(lazy=True).debug(
+                        "Stashing {} TOAs", lambda: self.selected.sum()
+                    )
+                    self.psr.stashed = pulsar.copy_TOAs(self.psr.all_toas)
 
                 else:  # if the stash isn't empty, remove selected from front-facing TOAs
-                    log.debug(
-                        f"Added {sum(self.selected)} TOAs to stash (stash now contains {len(self.psr.stashed.table)-len(self.psr.all_toas.table)+sum(self.selected)} TOAs)"
+                    log.opt(lazy=True).debug(
+                        "Added {} TOAs to stash (stash now contains {} TOAs)",
+                        lambda: self.selected.sum(),
+                        lambda: len(self.psr.stashed.table)
+                        - len(self.psr.all_toas.table)
+                        + self.selected.sum(),
                     )
                 if self.psr.fitted and self.psr.use_pulse_numbers:
                     self.psr.all_toas.compute_pulse_numbers(self.psr.postfit_model)
 
                 # remove the newly-stashed TOAs from the front-facing TOAs
                 self.psr.all_toas.table = self.psr.all_toas.table[~self.selected]
-                self.psr.selected_toas = copy.deepcopy(self.psr.all_toas)
-                self.selected = np.zeros(self.psr.all_toas.ntoas, dtype=bool)
+                self.psr.selected_toas = pulsar.copy_TOAs(self.psr.all_toas)
+                self.selected = clearedMask(self.selected, self.psr.all_toas.ntoas)
                 self.updateAllJumped()
                 self.psr.update_resids()
                 self.updatePlot(
@@ -55,6 +55,23 @@ nofitboxpars = [
 ]
 
 
+def copy_TOAs(toas):
+    """Copy TOAs, much faster than a deep copy
+
+    The table and the flags of each TOA are copied, but the time objects in
+    the table are shared with the original (they are never changed in place).
+    """
+    new = copy.copy(toas)
+    for name, value in vars(toas).items():
+        if name != "table":
+            setattr(new, name, copy.deepcopy(value))
+    new.table = toas.table.copy()
+    flags = new.table["flags"]
+    for i in range(len(flags)):
+        flags[i] = flags[i].copy()
+    return new
+
+
 class Pulsar:
     """Wrapper class for a pulsar.
 
@@ -87,7 +104,7 @@ class Pulsar:
             self.prefit_model.jump_params_to_flags(self.all_toas)
         # turns pre-existing jump flags in toas.table['flags'] into parameters in parfile
         self.prefit_model.jump_flags_to_params(self.all_toas)
-        self.selected_toas = copy.deepcopy(self.all_toas)
+        self.selected_toas = copy_TOAs(self.all_toas)
         print("The prefit model as a parfile:")
         print(self.prefit_model.as_parfile())
         # adds extra prefix params for fitting
@@ -121,6 +138,8 @@ class Pulsar:
         self.faketoas1 = None  # for random models
         self.faketoas = None  # for random models
         self.use_pulse_numbers = False
+        # counts the changes to the jump flags of all_toas made in place
+        self.jump_flags_version = 0
 
     @property
     def name(self):
@@ -152,7 +171,7 @@ class Pulsar:
             self.prefit_model.jump_params_to_flags(self.all_toas)
         # turns pre-existing jump flags in toas.table['flags'] into parameters in parfile
         self.prefit_model.jump_flags_to_params(self.all_toas)
-        self.selected_toas = copy.deepcopy(self.all_toas)
+        self.selected_toas = copy_TOAs(self.all_toas)
         self.deleted = set([])
         self.stashed = None
         self.update_resids()
@@ -180,7 +199,7 @@ class Pulsar:
         # Now delete from all_toas
         self.all_toas.table = self._delete_TOAs(self.all_toas.table)
         if self.selected_toas.table is None:  # all selected were deleted
-            self.selected_toas = copy.deepcopy(self.all_toas)
+            self.selected_toas = copy_TOAs(self.all_toas)
             selected = np.zeros(self.selected_toas.ntoas, dtype=bool)
         else:
             # Make a new selected list by adding a value if the table
@@ -316,6 +335,7 @@ class Pulsar:
                 )
             )
             print("-" * 132)
+            lines = []
             for key in self.prefit_model.free_params:
                 line = "%8s " % key
                 pre = getattr(self.prefit_model, key)
@@ -324,15 +344,16 @@ class Pulsar:
                 if post.quantity is not None:
                     line += "%24s\t" % pre.str_quantity(pre.quantity)
                     line += "%24s\t" % post.str_quantity(post.quantity)
-                    try:
+                    if post.uncertainty is not None:
                         line += "%16.8g  " % post.uncertainty.value
-                    except:
+                    else:
                         line += "%18s" % ""
                     diff = post.value - pre.value
                     line += "%16.8g  " % diff
                     if pre.uncertainty is not None and pre.uncertainty.value != 0.0:
                         line += "%16.8g" % (diff / pre.uncertainty.value)
-                print(line)
+                lines.append(line)
+            print("\n".join(lines))
         else:
             log.warning("Pulsar has not been fitted yet!")
 
@@ -376,6 +397,7 @@ class Pulsar:
 
         :param selected: boolean array to apply to toas, True = selected toa
         """
+        self.jump_flags_version += 1
         # TODO: split into two functions
         if "PhaseJump" not in self.prefit_model.components:
             # if no PhaseJump component, add one
@@ -2207,6 +2207,7 @@ class TOAs:
         log.debug(f"Using EPHEM = {self.ephem} for TDB calculation.")
         # Compute in observatory groups
         tdbs = np.zeros_like(self.table["mjd"])
+        tdblds = np.zeros(len(self.table), dtype=np.longdouble)
         for obs, grp in self.get_obs_groups():
             site = get_observatory(obs)
             if isinstance(site, TopoObs):
@@ -2236,9 +2237,11 @@ class TOAs:
 
             grptdbs = site.get_TDBs(grpmjds, method=method, ephem=ephem)
             tdbs[grp] = np.asarray([t for t in grptdbs])
+            # Convert the whole group at once rather than one Time at a time
+            tdblds[grp] = grptdbs.tdb.mjd_long
         # Now add the new columns to the table
         col_tdb = table.Column(name="tdb", data=tdbs)
-        col_tdbld = table.Column(name="tdbld", data=[t.tdb.mjd_long for t in tdbs])
+        col_tdbld = table.Column(name="tdbld", data=tdblds)
         self.table.add_columns([col_tdb, col_tdbld])
 
     def compute_posvels(self, ephem=None, planets=None):
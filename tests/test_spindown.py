@@ -1,9 +1,17 @@
+import copy
+import pickle
+from fractions import Fraction
 from io import StringIO
+from math import factorial
 
+import astropy.units as u
+import numpy as np
 import pytest
+from numpy.testing import assert_allclose
 
 from pint.models import get_model
 from pint.simulation import make_fake_toas_uniform
+from pint.utils import check_longdouble_precision
 
 par_base = """
     PSR J1235+5678
@@ -40,3 +48,122 @@ def test_removed_f1():
 def test_missing_f2():
     with pytest.raises(ValueError):
         get_model(StringIO("\n".join([par_base, "F3 0"])))
+
+
+# Barycentric TOAs need neither clock corrections nor a downloaded ephemeris
+par_bary = par_base + "    EPHEM DE432s\n"
+
+
+def fake_toas(model, start, end):
+    return make_fake_toas_uniform(start, end, 10, model, obs="@", include_gps=False)
+
+
+def test_d_phase_d_F_all():
+    m = get_model(StringIO("\n".join([par_bary, "F1 -1e-14", "F2 1e-25"])))
+    toas = fake_toas(m, 56000, 58000)
+    delay = m.delay(toas)
+    sd = m.components["Spindown"]
+    derivs = sd.d_phase_d_F_all(toas, delay)
+    assert derivs.shape == (toas.ntoas, 3)
+    dt = sd.get_dt(toas, delay).to_value(u.s)
+    for k, p in enumerate(sd.F_terms):
+        assert_allclose(derivs[:, k], dt ** (k + 1) / factorial(k + 1), rtol=1e-15)
+        d = sd.d_phase_d_F(toas, p, delay)
+        assert_allclose(d.to_value(1 / getattr(m, p).units), derivs[:, k], rtol=0)
+
+
+def test_spindown_phase_follows_pepoch_and_delay():
+    m = get_model(StringIO("\n".join([par_bary, "F1 -1e-14"])))
+    toas = fake_toas(m, 56000, 58000)
+    delay = m.delay(toas)
+    sd = m.components["Spindown"]
+    sd.spindown_phase(toas, delay)
+    m.PEPOCH.value = 56500
+    for d in [delay, 2 * delay]:
+        dt = sd.get_dt(toas, d).to_value(u.s)
+        expected = m.F0.value * dt + m.F1.value * dt**2 / 2
+        phase = sd.spindown_phase(toas, d).to_value(u.dimensionless_unscaled)
+        assert_allclose(phase, expected, rtol=1e-15)
+
+
+def test_d_spindown_phase_d_delay():
+    m = get_model(StringIO("\n".join([par_bary, "F1 -1e-14", "F2 1e-25"])))
+    toas = fake_toas(m, 56000, 58000)
+    delay = m.delay(toas)
+    sd = m.components["Spindown"]
+    dt = sd.get_dt(toas, delay).to_value(u.s)
+    d = sd.d_spindown_phase_d_delay(toas, delay)
+    expected = -(m.F0.value + m.F1.value * dt + m.F2.value * dt**2 / 2)
+    assert_allclose(d.to_value(1 / u.s), expected, rtol=1e-15)
+
+
+def test_d_phase_d_astrometry():
+    m = get_model(StringIO("\n".join([par_bary, "F1 -1e-14"])))
+    m.ELONG.frozen = False
+    toas = fake_toas(m, 56000, 58000)
+    d = m.d_phase_d_param(toas, m.delay(toas), "ELONG")
+    assert d.unit == 1 / m.ELONG.units
+    assert np.all(np.isfinite(d))
+
+
+def test_copies_compute_the_same():
+    m = get_model(StringIO("\n".join([par_bary, "F1 -1e-14"])))
+    toas = fake_toas(m, 56000, 58000)
+    delay = m.delay(toas)
+    sd = m.components["Spindown"]
+    phase = sd.spindown_phase(toas, delay)
+    derivs = sd.d_phase_d_F_all(toas, delay)
+    for c in [copy.deepcopy(m), pickle.loads(pickle.dumps(m))]:
+        csd = c.components["Spindown"]
+        assert_allclose(csd.spindown_phase(toas, delay), phase, rtol=0)
+        assert_allclose(csd.d_phase_d_F_all(toas, delay), derivs, rtol=0)
+
+
+def test_spin_term_changes_are_seen():
+    m = get_model(StringIO("\n".join([par_bary, "F1 -1e-14"])))
+    toas = fake_toas(m, 56000, 58000)
+    delay = m.delay(toas)
+    sd = m.components["Spindown"]
+    dt = sd.get_dt(toas, delay).to_value(u.s)
+    phase = sd.spindown_phase(toas, delay)
+    derivs = sd.d_phase_d_F_all(toas, delay)
+
+    m.F0.value = 2
+    m.F1.value = -3e-14
+    new_phase = sd.spindown_phase(toas, delay)
+    assert not np.allclose(new_phase, phase)
+    assert_allclose(new_phase, 2 * dt - 3e-14 * dt**2 / 2, rtol=1e-15)
+
+    sd.add_param(m.F1.new_param(2), setup=True)
+    m.F2.value = 0
+    sd.add_param(m.F1.new_param(3), setup=True)
+    m.F3.value = 1e-35
+    assert_allclose(
+        sd.spindown_phase(toas, delay),
+        2 * dt - 3e-14 * dt**2 / 2 + 1e-35 * dt**4 / 24,
+        rtol=1e-15,
+    )
+    new_derivs = sd.d_phase_d_F_all(toas, delay)
+    assert derivs.shape == (toas.ntoas, 2)
+    assert new_derivs.shape == (toas.ntoas, 4)
+    assert_allclose(new_derivs[:, :2], derivs, rtol=0)
+    assert_allclose(new_derivs[:, 3], dt**4 / 24, rtol=1e-15)
+
+
+@pytest.mark.skipif(
+    not check_longdouble_precision(), reason="long doubles lack extended precision"
+)
+def test_spindown_phase_long_double_precision():
+    par = par_bary.replace("F0 1", "F0 218.811843796082627")
+    m = get_model(StringIO("\n".join([par, "F1 -4.083e-16", "F2 1.2e-27"])))
+    toas = fake_toas(m, 53000, 58000)
+    delay = m.delay(toas)
+    sd = m.components["Spindown"]
+    dt = sd.get_dt(toas, delay).to_value(u.s)
+    phase = sd.spindown_phase(toas, delay).to_value(u.dimensionless_unscaled)
+    fs = [Fraction(*getattr(m, p).value.as_integer_ratio()) for p in sd.F_terms]
+    for t, ph in zip(dt, phase):
+        t = Fraction(*t.as_integer_ratio())
+        exact = sum(f * t ** (k + 1) / factorial(k + 1) for k, f in enumerate(fs))
+        # Far tighter than double precision could manage for ~1e10 turns
+        assert abs(Fraction(*ph.as_integer_ratio()) - exact) <= abs(exact) * 1e-18